@@ -5,6 +5,7 @@ import time
 
 from kmk.extensions import Extension, InvalidExtensionEnvironment
 from kmk.keys import make_key
+from kmk.scheduler import cancel_task, create_task
 
 
 class statusLED(Extension):
@@ -25,6 +26,7 @@ class statusLED(Extension):
                     'Unable to create pulseio.PWMOut() instance with provided led_pin'
                 )
         self._led_count = len(self._leds)
+        self._task = None
 
         self.brightness = brightness
         self._layer_last = -1
@@ -74,6 +76,7 @@ class statusLED(Extension):
 
     def during_bootup(self, sandbox):
         '''Light up every single led once for 200 ms'''
+        self._task = create_task(self._wake_indicator_off, after_ms=-1)
         for i in range(self._led_count + 2):
             if i < self._led_count:
                 self._leds[i].duty_cycle = int(self.brightness / 100 * 65535)
@@ -105,10 +108,15 @@ class statusLED(Extension):
     def on_powersave_disable(self, sandbox):
         self.set_brightness(self.brightness)
         self._leds[2].duty_cycle = int(50 / 100 * 65535)
-        time.sleep(0.2)
-        self._leds[2].duty_cycle = int(0)
+        # Turn the wake indicator off from the scheduler instead of sleeping,
+        # so the key press that woke us up isn't delayed.
+        cancel_task(self._task)
+        create_task(self._task, after_ms=200)
         return
 
+    def _wake_indicator_off(self):
+        self._leds[2].duty_cycle = int(0)
+
     def set_brightness(self, percent, layer_id=-1):
         if layer_id < 0:
             for led in self._leds:
@@ -7,6 +7,9 @@ import time
 from kmk.keys import AX
 from kmk.modules import Module
 from kmk.modules.adns9800_firmware import firmware
+from kmk.utils import Debug
+
+debug = Debug(__name__)
 
 
 class REG:
@@ -76,6 +79,11 @@ class ADNS9800(Module):
         self.invert_x = invert_x
         self.invert_y = invert_y
 
+        # SPI buffers are reused for every transfer, motion is read each scan
+        self._cmd = bytearray(1)
+        self._reg = bytearray(2)
+        self._motion = bytearray(14)
+
     def adns_start(self):
         self.cs.value = False
 
@@ -88,19 +96,22 @@ class ADNS9800(Module):
         try:
             self.spi.configure(baudrate=self.baud, polarity=self.cpol, phase=self.cpha)
             self.adns_start()
-            self.spi.write(bytes([reg | self.DIR_WRITE, data]))
+            self._reg[0] = reg | self.DIR_WRITE
+            self._reg[1] = data
+            self.spi.write(self._reg)
         finally:
             self.spi.unlock()
             self.adns_stop()
 
     def adns_read(self, reg):
-        result = bytearray(1)
+        result = self._cmd
         while not self.spi.try_lock():
             pass
         try:
             self.spi.configure(baudrate=self.baud, polarity=self.cpol, phase=self.cpha)
             self.adns_start()
-            self.spi.write(bytes([reg & self.DIR_READ]))
+            result[0] = reg & self.DIR_READ
+            self.spi.write(result)
             microcontroller.delay_us(self.tsrad)
             self.spi.readinto(result)
         finally:
@@ -115,9 +126,12 @@ class ADNS9800(Module):
         try:
             self.spi.configure(baudrate=self.baud, polarity=self.cpol, phase=self.cpha)
             self.adns_start()
-            self.spi.write(bytes([REG.SROM_Load_Burst | self.DIR_WRITE]))
+            cmd = self._cmd
+            cmd[0] = REG.SROM_Load_Burst | self.DIR_WRITE
+            self.spi.write(cmd)
             for b in firmware:
-                self.spi.write(bytes([b]))
+                cmd[0] = b
+                self.spi.write(cmd)
         finally:
             self.spi.unlock()
             self.adns_stop()
@@ -129,13 +143,14 @@ class ADNS9800(Module):
         return comp
 
     def adns_read_motion(self):
-        result = bytearray(14)
+        result = self._motion
         while not self.spi.try_lock():
             pass
         try:
             self.spi.configure(baudrate=self.baud, polarity=self.cpol, phase=self.cpha)
             self.adns_start()
-            self.spi.write(bytes([REG.Motion_Burst & self.DIR_READ]))
+            self._cmd[0] = REG.Motion_Burst & self.DIR_READ
+            self.spi.write(self._cmd)
             microcontroller.delay_us(self.tsrad)
             self.spi.readinto(result)
         finally:
@@ -177,17 +192,17 @@ class ADNS9800(Module):
         self.adns_write(REG.Configuration_I, 0x10)
         microcontroller.delay_us(self.tsww)
 
-        if keyboard.debug_enabled:
-            print('ADNS: Product ID ', hex(self.adns_read(REG.Product_ID)))
+        if debug.enabled:
+            debug('ADNS: Product ID ', hex(self.adns_read(REG.Product_ID)))
             microcontroller.delay_us(self.tsrr)
-            print('ADNS: Revision ID ', hex(self.adns_read(REG.Revision_ID)))
+            debug('ADNS: Revision ID ', hex(self.adns_read(REG.Revision_ID)))
             microcontroller.delay_us(self.tsrr)
-            print('ADNS: SROM ID ', hex(self.adns_read(REG.SROM_ID)))
+            debug('ADNS: SROM ID ', hex(self.adns_read(REG.SROM_ID)))
             microcontroller.delay_us(self.tsrr)
             if self.adns_read(REG.Observation) & 0x20:
-                print('ADNS: Sensor is running SROM')
+                debug('ADNS: Sensor is running SROM')
             else:
-                print('ADNS: Error! Sensor is not running SROM!')
+                debug('ADNS: Error! Sensor is not running SROM!')
 
         return
 
@@ -208,8 +223,8 @@ class ADNS9800(Module):
             if delta_y:
                 AX.Y.move(keyboard, delta_y)
 
-            if keyboard.debug_enabled:
-                print('Delta: ', delta_x, ' ', delta_y)
+            if debug.enabled:
+                debug('Delta: ', delta_x, ' ', delta_y)
 
     def after_matrix_scan(self, keyboard):
         return
@@ -188,20 +188,32 @@ class DynamicSequences(Module):
 
     # Configuration for repeating sequences
     def config_mode(self, keyboard):
-        for key in keyboard.keys_pressed.difference(self.last_config_frame):
-            if key.code in _numbers:
-                digit = (key.code - KC.N1.code + 1) % 10
-                if self.status == SequenceStatus.SET_REPEPITIONS:
-                    self.current_slot.repetitions = (
-                        self.current_slot.repetitions * 10 + digit
-                    )
-                elif self.status == SequenceStatus.SET_INTERVAL:
-                    self.current_slot.interval = self.current_slot.interval * 10 + digit
-
-            elif key.code == KC.ENTER.code:
-                self.stop_config()
+        keys_pressed = keyboard.keys_pressed
+        last_config_frame = self.last_config_frame
+
+        # Only rebuild the frame when something changed, and look for new keys
+        # in place instead of allocating a difference set every cycle.
+        if keys_pressed != last_config_frame:
+            for key in keys_pressed:
+                if key in last_config_frame:
+                    continue
+
+                if key.code in _numbers:
+                    digit = (key.code - KC.N1.code + 1) % 10
+                    if self.status == SequenceStatus.SET_REPEPITIONS:
+                        self.current_slot.repetitions = (
+                            self.current_slot.repetitions * 10 + digit
+                        )
+                    elif self.status == SequenceStatus.SET_INTERVAL:
+                        self.current_slot.interval = (
+                            self.current_slot.interval * 10 + digit
+                        )
+
+                elif key.code == KC.ENTER.code:
+                    self.stop_config()
+
+            self.last_config_frame = keys_pressed.copy()
 
-        self.last_config_frame = keyboard.keys_pressed.copy()
         keyboard.hid_pending = False  # Disable typing
 
         if not check_deadline(ticks_ms(), self.start_time, self.timeout):
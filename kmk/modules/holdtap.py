@@ -205,7 +205,7 @@ class HoldTap(Module):
             state = self.key_states[key]
         except KeyError:
             if debug.enabled:
-                debug(f'on_tap_time_expired: no such key {key}')
+                debug('on_tap_time_expired: no such key ', key)
             return
 
         if self.key_states[key].activated == ActivationType.PRESSED:
@@ -140,7 +140,7 @@ class Layers(HoldTap):
 
     def _print_debug(self, keyboard):
         if debug.enabled:
-            debug(f'active_layers={keyboard.active_layers}')
+            debug('active_layers=', keyboard.active_layers)
 
     def activate_layer(self, keyboard, layer, idx=None):
         if idx is None:
@@ -166,7 +166,7 @@ class Layers(HoldTap):
                 del keyboard.active_layers[idx]
             except ValueError:
                 if debug.enabled:
-                    debug(f'_mo_released: layer {layer} not active')
+                    debug('_mo_released: layer ', layer, ' not active')
 
             if self.combo_layers:
                 self._deactivate_combo_layer(keyboard, layer)
@@ -76,7 +76,7 @@ class OneShot(HoldTap):
             state = self.key_states[key]
         except KeyError:
             if debug.enabled:
-                debug(f'OneShot.osk_released: no such key {key}')
+                debug('OneShot.osk_released: no such key ', key)
             return keyboard
 
         if state.activated == ActivationType.PRESSED:
@@ -91,10 +91,15 @@ class MatrixScanner(Scanner):
         ba_idx = 0
         any_changed = False
 
+        # Hoist attribute lookups out of the scan loop, it runs every cycle.
+        pull_up = self.pull is digitalio.Pull.UP
+        state = self.state
+        inputs = self.inputs
+
         for oidx, opin in enumerate(self.outputs):
-            opin.value = self.pull is not digitalio.Pull.UP
+            opin.value = not pull_up
 
-            for iidx, ipin in enumerate(self.inputs):
+            for iidx, ipin in enumerate(inputs):
                 # cast to int to avoid
                 #
                 # >>> xyz = bytearray(3)
@@ -107,7 +112,7 @@ class MatrixScanner(Scanner):
                 # almost certainly because bool types in Python aren't just
                 # aliases to int values, but are proper pseudo-types
                 new_val = int(ipin.value)
-                old_val = self.state[ba_idx]
+                old_val = state[ba_idx]
 
                 if old_val != new_val:
                     if self.translate_coords:
@@ -124,18 +129,18 @@ class MatrixScanner(Scanner):
                         row = oidx
                         col = iidx
 
-                    if self.pull is digitalio.Pull.UP:
+                    if pull_up:
                         pressed = not new_val
                     else:
                         pressed = new_val
-                    self.state[ba_idx] = new_val
+                    state[ba_idx] = new_val
 
                     any_changed = True
                     break
 
                 ba_idx += 1
 
-            opin.value = self.pull is digitalio.Pull.UP
+            opin.value = pull_up
             if any_changed:
                 break
 